@@ -18,25 +18,25 @@
 # Adrien Crovato
 
 import gmshcfd
+import numpy as np
 
 def build_cfg():
     # Build path
     import os.path
-    airf_path = []
-    for i in range(8):
-        airf_path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), 'airfoils', f'lann_{i}.dat')))
+    airf_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), 'airfoils'))
+    airf_path = [os.path.join(airf_dir, f'lann_{i}.dat') for i in range(8)]
     # Define wing leading edge coordinates and chord lengths
-    le_coords = [[0.0, 0.0, 0.0],
-                 [0.10408, 0.2, 0.0],
-                 [0.16913, 0.325, 0.0],
-                 [0.24720, 0.475, 0.0],
-                 [0.33827, 0.65, 0.0],
-                 [0.42934, 0.825, 0.0],
-                 [0.49439, 0.95, 0.0],
-                 [0.52041, 1.0, 0.0]]
-    chords = [0.3606, 0.31765, 0.29071, 0.25806, 0.22029, 0.18235, 0.15534, 0.14445]
+    le_coords = np.array([[0.0, 0.0, 0.0],
+                          [0.10408, 0.2, 0.0],
+                          [0.16913, 0.325, 0.0],
+                          [0.24720, 0.475, 0.0],
+                          [0.33827, 0.65, 0.0],
+                          [0.42934, 0.825, 0.0],
+                          [0.49439, 0.95, 0.0],
+                          [0.52041, 1.0, 0.0]])
+    chords = np.array([0.3606, 0.31765, 0.29071, 0.25806, 0.22029, 0.18235, 0.15534, 0.14445])
     # Compute mesh sizes
-    sizes = [c / 100 for c in chords]
+    sizes = chords / 100
     ff_size = gmshcfd.utils.compute_ff_mesh_size(sizes[0], 50 * chords[0], 1.2)
     # Build cfg
     cfg = {
@@ -46,7 +46,7 @@ def build_cfg():
                 'le_offsets': le_coords,
                 'airfoils': airf_path,
                 'chords': chords,
-                'incidences': [0. for _ in chords]
+                'incidences': np.zeros_like(chords)
             }
         },
         'domain': {
@@ -56,8 +56,8 @@ def build_cfg():
         'mesh': {
             'wing_sizes': {
                 'wing': {
-                    'te': [s for s in sizes],
-                    'le': [s for s in sizes]
+                    'te': sizes,
+                    'le': sizes
                 }
                 #'wing': {
                 #    'num_cell_chord': 125,
@@ -80,14 +80,14 @@ def build_cfg():
 
 def main():
     # Generate wing and domain geometry
-    cfd = gmshcfd.GmshCFD('lann', build_cfg())
-    cfd.generate_geometry()
+    with gmshcfd.GmshCFD('lann', build_cfg()) as cfd:
+        cfd.generate_geometry()
 
-    # Generate mesh
-    cfd.generate_mesh()
+        # Generate mesh
+        cfd.generate_mesh()
 
-    # Write mesh (write geometry not supported for extruded boundary layer)
-    cfd.write_mesh('msh')
+        # Write mesh (write geometry not supported for extruded boundary layer)
+        cfd.write_mesh('msh')
 
     # eof
     print('')
@@ -22,7 +22,8 @@ import gmshcfd
 def build_cfg():
     # Build path
     import os.path
-    apath = os.path.abspath(os.path.join(os.path.dirname(__file__), 'airfoils', 'onera_m6.dat'))
+    airf_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), 'airfoils'))
+    apath = os.path.join(airf_dir, 'onera_m6.dat')
     airf_path =  [apath, apath]
     # Compute wing leading edge coordinates and chord lengths
     le_coords, chords = gmshcfd.utils.compute_wing_cfg([1.196], [0.56], [30], [0], 0.8059)
@@ -60,15 +61,15 @@ def build_cfg():
 
 def main():
     # Generate wing and domain geometry
-    cfd = gmshcfd.GmshCFD('m6', build_cfg())
-    cfd.generate_geometry()
+    with gmshcfd.GmshCFD('m6', build_cfg()) as cfd:
+        cfd.generate_geometry()
 
-    # Generate mesh
-    cfd.generate_mesh()
+        # Generate mesh
+        cfd.generate_mesh()
 
-    # Write geometry and mesh
-    cfd.write_geometry()
-    cfd.write_mesh('msh2')
+        # Write geometry and mesh
+        cfd.write_geometry()
+        cfd.write_mesh('msh2')
 
     # eof
     print('')
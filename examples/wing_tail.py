@@ -22,8 +22,9 @@ import gmshcfd
 def build_cfg():
     # Build path
     import os.path
-    wairf_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'airfoils', 'rae_2822.dat'))
-    tairf_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'airfoils', 'naca_0012.dat'))
+    airf_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), 'airfoils'))
+    wairf_path = os.path.join(airf_dir, 'rae_2822.dat')
+    tairf_path = os.path.join(airf_dir, 'naca_0012.dat')
     airf_path =  [[wairf_path, wairf_path, wairf_path], [tairf_path, tairf_path]]
     # Compute wing and tail leading edge coordinates and chord lengths
     wle_coords, wchords = gmshcfd.utils.compute_wing_cfg([0.5, 3.0], [0.82, 0.35], [20., 20.], [1., 3.], 1.0)
@@ -72,15 +73,15 @@ def build_cfg():
 
 def main():
     # Generate wing and domain geometry
-    cfd = gmshcfd.GmshCFD('wing_tail', build_cfg())
-    cfd.generate_geometry()
+    with gmshcfd.GmshCFD('wing_tail', build_cfg()) as cfd:
+        cfd.generate_geometry()
 
-    # Generate mesh
-    cfd.generate_mesh()
+        # Generate mesh
+        cfd.generate_mesh()
 
-    # Write geometry and mesh
-    cfd.write_geometry()
-    cfd.write_mesh('msh')
+        # Write geometry and mesh
+        cfd.write_geometry()
+        cfd.write_mesh('msh')
 
     # eof
     print('')
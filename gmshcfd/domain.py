@@ -35,46 +35,25 @@ class Box:
     def __order_wakes(self, wings):
         """Order the lifting surfaces according to the z-coordinate of their trailing edge on the symmetry plane
         """
-        idx = []
-        zc = []
-        for i in range(len(wings)):
-            idx.append(i)
-            zc.append(wings[i].height)
-        return [x for _, x in sorted(zip(zc, idx))]
+        return sorted(range(len(wings)), key=lambda i: wings[i].height)
 
     def __create_model(self, wings, wing_order, cfg, mesh_cfg):
         """Create domain points, curves, surfaces and volume in Gmsh model
         """
         # Add points
-        ptags = []
-        for i in range(2):
-            ptag = []
-            ptag.append(gmsh.model.geo.add_point(cfg['length'], i*cfg['length'], cfg['length']))
-            ptag.append(gmsh.model.geo.add_point(-cfg['length'], i*cfg['length'], cfg['length']))
-            ptag.append(gmsh.model.geo.add_point(-cfg['length'], i*cfg['length'], -cfg['length']))
-            ptag.append(gmsh.model.geo.add_point(cfg['length'], i*cfg['length'], -cfg['length']))
-            ptags.append(ptag)
+        L = cfg['length']
+        corners = [(L, L), (-L, L), (-L, -L), (L, -L)]
+        ptags = [[gmsh.model.geo.add_point(x, i * L, z) for x, z in corners] for i in range(2)]
 
         # Add curves
         oxz_ctags = []
         # oxz plane, symmetry side
-        ctag = []
-        for i in range(3):
-            ctag.append(gmsh.model.geo.add_line(ptags[0][i], ptags[0][i+1]))
-        ctag.append(gmsh.model.geo.add_line(ptags[0][3], wings[wing_order[0]].wake.tags['symmetry_point']))
-        for i in range(len(wing_order) - 1):
-            ctag.append(gmsh.model.geo.add_line(wings[wing_order[i]].wake.tags['symmetry_point'], wings[wing_order[i+1]].wake.tags['symmetry_point']))
-        ctag.append(gmsh.model.geo.add_line(wings[wing_order[-1]].wake.tags['symmetry_point'], ptags[0][0]))
-        oxz_ctags.append(ctag)
+        sym_ptags = ptags[0] + [wings[w].wake.tags['symmetry_point'] for w in wing_order] + [ptags[0][0]]
+        oxz_ctags.append([gmsh.model.geo.add_line(sym_ptags[i], sym_ptags[i+1]) for i in range(len(sym_ptags) - 1)])
         # oxz plane, back side
-        ctag = []
-        for i in range(4):
-            ctag.append(gmsh.model.geo.add_line(ptags[1][i], ptags[1][(i+1) % 4]))
-        oxz_ctags.append(ctag)
+        oxz_ctags.append([gmsh.model.geo.add_line(ptags[1][i], ptags[1][(i+1) % 4]) for i in range(4)])
         # oxy plane
-        oyz_ctags = []
-        for i in range(4):
-            oyz_ctags.append(gmsh.model.geo.add_line(ptags[0][i], ptags[1][i]))
+        oyz_ctags = [gmsh.model.geo.add_line(ptags[0][i], ptags[1][i]) for i in range(4)]
 
         # Add surfaces
         stags = []
@@ -99,10 +78,10 @@ class Box:
         stags.append(gmsh.model.geo.add_plane_surface([cltag]))
 
         # Add volume
-        wing_tags = []
+        sl_stags = list(stags)
         for w in wings:
-            wing_tags.extend(w.tags['wing_surfaces'])
-        sltag = gmsh.model.geo.add_surface_loop(stags + wing_tags)
+            sl_stags.extend(w.tags['wing_surfaces'])
+        sltag = gmsh.model.geo.add_surface_loop(sl_stags)
         vtag = gmsh.model.geo.add_volume([sltag])
 
         # Add embbeded entities
@@ -119,7 +98,6 @@ class Box:
         gmsh.model.mesh.embed(2, wake_tags, 3, vtag)
 
         # Add physical groups
-        gmsh.model.geo.synchronize()
         gmsh.model.add_physical_group(2, [stags[0]], name='symmetry')
         gmsh.model.add_physical_group(2, [stags[1]], name='upstream')
         gmsh.model.add_physical_group(2, [stags[2]], name='downstream')
@@ -127,9 +105,7 @@ class Box:
         gmsh.model.add_physical_group(3, [vtag], name='field')
 
         # Add meshing constraints
-        for i in range(2):
-            for j in range(len(ptags[i])):
-                gmsh.model.mesh.set_size([(0, ptags[i][j])], mesh_cfg['domain_size'])
+        gmsh.model.mesh.set_size([(0, tag) for row in ptags for tag in row], mesh_cfg['domain_size'])
 
 class Sphere:
     """Sphere-shaped domain
@@ -151,25 +127,16 @@ class Sphere:
         """
         # Add points
         c_ptag = gmsh.model.geo.add_point(0., 0., 0.) # center of the sphere
-        ptags = []
-        ptags.append(gmsh.model.geo.add_point(cfg['length'], 0., 0.))
-        ptags.append(gmsh.model.geo.add_point(0., 0., cfg['length']))
-        ptags.append(gmsh.model.geo.add_point(-cfg['length'], 0., 0.))
-        ptags.append(gmsh.model.geo.add_point(0., 0., -cfg['length']))
-        ptags.append(gmsh.model.geo.add_point(0., cfg['length'], 0.))
+        L = cfg['length']
+        coords = [(L, 0., 0.), (0., 0., L), (-L, 0., 0.), (0., 0., -L), (0., L, 0.)]
+        ptags = [gmsh.model.geo.add_point(x, y, z) for x, y, z in coords]
 
         # Add curves
         ctags = []
         # symmetry plane
-        ctag = []
-        for i in range(4):
-            ctag.append(gmsh.model.geo.add_circle_arc(ptags[i], c_ptag, ptags[(i+1) % 4]))
-        ctags.append(ctag)
+        ctags.append([gmsh.model.geo.add_circle_arc(ptags[i], c_ptag, ptags[(i+1) % 4]) for i in range(4)])
         # outside symmetry plane
-        ctag = []
-        for i in range(4):
-            ctag.append(gmsh.model.geo.add_circle_arc(ptags[i], c_ptag, ptags[-1]))
-        ctags.append(ctag)
+        ctags.append([gmsh.model.geo.add_circle_arc(ptags[i], c_ptag, ptags[-1]) for i in range(4)])
 
         # Add surfaces
         stags = []
@@ -185,11 +152,11 @@ class Sphere:
             stags.append(gmsh.model.geo.add_surface_filling([cltag]))
 
         # Add volume
-        wing_tags = []
+        sl_stags = list(stags)
         tag_name = 'boundary_layer_top' if cfg['type'] == 'rans' else 'wing'
         for w in wings:
-            wing_tags.extend(w.tags[tag_name + '_surfaces'])
-        sltag = gmsh.model.geo.add_surface_loop(stags + wing_tags)
+            sl_stags.extend(w.tags[tag_name + '_surfaces'])
+        sltag = gmsh.model.geo.add_surface_loop(sl_stags)
         vtag = gmsh.model.geo.add_volume([sltag])
 
         # Add physical groups
@@ -207,5 +174,4 @@ class Sphere:
         gmsh.model.add_physical_group(3, vtags, name='field')
 
         # Add meshing constraints
-        for i in range(len(ptags)):
-            gmsh.model.mesh.set_size([(0, ptags[i])], mesh_cfg['domain_size'])
+        gmsh.model.mesh.set_size([(0, tag) for tag in ptags], mesh_cfg['domain_size'])
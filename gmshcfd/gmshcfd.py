@@ -16,6 +16,7 @@
 
 from .wing import Wing
 from .domain import Box, Sphere
+from concurrent.futures import ThreadPoolExecutor
 import gmsh, os
 
 class GmshCFD:
@@ -26,6 +27,8 @@ class GmshCFD:
         name of the model
     cfg: dict
         geometrical and mesh parameters
+    verbose: bool
+        whether to display Gmsh messages and write them to a log file
 
     Attributes:
     name: string
@@ -41,54 +44,95 @@ class GmshCFD:
     domain: gmshcfd.Box or Sphere object
         domain
     """
-    def __init__(self, name, cfg):
+    def __init__(self, name, cfg, verbose=False):
         # Initialize attributes
+        self.__initialized = False
         self.__name = name
         self.__wing_cfgs = cfg['wings']
         self.__domain_cfg = cfg['domain']
         self.__mesh_cfg = cfg['mesh']
+        self.__verbose = verbose
         self.__wings = []
         self.__domain = None
-        # Start Gmsh logger
-        gmsh.initialize()
-        gmsh.logger.start()
-        gmsh.model.add(name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def __del__(self):
-        # Get log and stop Gmsh
-        log_msgs = gmsh.logger.get()
-        gmsh.logger.stop()
-        file = open(f'log_{self.__name}', 'w')
-        for m in log_msgs:
-            file.write(m + '\n')
-        file.close()
+        # Fallback if close was not called explicitly
+        self.close()
+
+    def __initialize(self):
+        """Start Gmsh and logger, and create the model
+        """
+        if self.__initialized:
+            return
+        gmsh.initialize()
+        # Only display errors and warnings if not verbose
+        if self.__verbose:
+            gmsh.logger.start()
+        else:
+            gmsh.option.set_number('General.Verbosity', 2)
+        gmsh.model.add(self.__name)
+        self.__initialized = True
+
+    def close(self):
+        """Write the log to disk if verbose and stop Gmsh
+        """
+        if not self.__initialized:
+            return
+        if self.__verbose:
+            log_msgs = gmsh.logger.get()
+            gmsh.logger.stop()
+            with open(f'log_{self.__name}', 'w') as file:
+                file.write(''.join(m + '\n' for m in log_msgs))
         gmsh.finalize()
+        self.__initialized = False
 
     def generate_geometry(self):
         """Generate the wings and the domain using the configurations
         """
-        # Create wings
-        for name, cfg in self.__wing_cfgs.items():
-            self.__wings.append(Wing(name, cfg, self.__domain_cfg, self.__mesh_cfg))
+        # Start Gmsh
+        self.__initialize()
+        # Create wings (coordinates are computed concurrently, Gmsh models are created sequentially)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            self.__wings = list(executor.map(lambda item: Wing(item[0], item[1], self.__domain_cfg, self.__mesh_cfg), self.__wing_cfgs.items()))
+        for wing in self.__wings:
+            wing.create_model()
         # Create domain
         if self.__domain_cfg['type'] == 'potential':
             self.__domain = Box(self.__wings, self.__domain_cfg, self.__mesh_cfg)
         else:
             self.__domain = Sphere(self.__wings, self.__domain_cfg, self.__mesh_cfg)
-        # Synchronize model
-        gmsh.model.geo.synchronize()
 
-    def generate_mesh(self, algo_2d='delaunay', algo_3d='hxt'):
+    def generate_mesh(self, algo_2d='delaunay', algo_3d='hxt', optimize=True, smoothing=10):
         """Generate mesh
+
+        Parameters:
+        algo_2d: string
+            surface meshing algorithm ('delaunay' or 'frontal-delaunay')
+        algo_3d: string
+            volume meshing algorithm ('delaunay' or 'hxt')
+        optimize: bool
+            whether to optimize the quality of the tetrahedra (can take a large part of the meshing time on large meshes)
+        smoothing: int
+            number of smoothing steps applied to the mesh (0 to disable)
         """
         algos_2d = {'delaunay': 5, 'frontal-delaunay': 6}
         algos_3d = {'delaunay': 1, 'hxt': 10}
         gmsh.option.set_number('Mesh.Algorithm', algos_2d[algo_2d])
         gmsh.option.set_number('Mesh.Algorithm3D', algos_3d[algo_3d])
-        gmsh.option.set_number('Mesh.Optimize', 1)
-        gmsh.option.set_number('Mesh.Smoothing', 10)
+        gmsh.option.set_number('Mesh.Optimize', int(optimize))
+        gmsh.option.set_number('Mesh.Smoothing', smoothing)
         gmsh.option.set_number('Mesh.SmoothNormals', 1)
-        gmsh.option.set_number('General.NumThreads', os.cpu_count())
+        n_threads = os.cpu_count()
+        gmsh.option.set_number('General.NumThreads', n_threads)
+        gmsh.option.set_number('Mesh.MaxNumThreads1D', n_threads)
+        gmsh.option.set_number('Mesh.MaxNumThreads2D', n_threads)
+        gmsh.option.set_number('Mesh.MaxNumThreads3D', n_threads)
         try:
             gmsh.model.mesh.generate(3)
         except Exception as e:
@@ -99,16 +143,15 @@ class GmshCFD:
         """Save geometry to disk and rename using .geo
         """
         gmsh.write(self.__name + '.geo_unrolled')
-        nname = self.__name + '.geo'
-        if os.path.isfile(nname):
-            os.remove(nname)
-        os.rename(self.__name + '.geo_unrolled', nname)
+        os.replace(self.__name + '.geo_unrolled', self.__name + '.geo')
 
-    def write_mesh(self, format):
-        """Save mesh to disk
+    def write_mesh(self, format, binary=True):
+        """Save mesh to disk, in binary if supported by the format (msh2 is always written in ASCII)
         """
         if format == 'msh2':
+            gmsh.option.set_number('Mesh.Binary', 0)
             gmsh.option.set_number('Mesh.MshFileVersion', 2.2)
             gmsh.write(self.__name + '.msh')
         else:
+            gmsh.option.set_number('Mesh.Binary', int(binary))
             gmsh.write(self.__name + '.' + format)
@@ -17,6 +17,44 @@
 import numpy as np
 from scipy.interpolate import PchipInterpolator
 import os, os.path
+import functools, io
+
+def load_airfoil(fpath):
+    """Load airfoil coordinates from file, parsing each file only once
+
+    Parameters:
+    fpath: str
+        path to file containing airfoil coordinates
+
+    Return:
+    _: ndarray
+        airfoil coordinates (copy that can be safely modified)
+    """
+    return _load_airfoil(fpath)[1]
+
+def _load_airfoil(fpath):
+    """Load airfoil header and coordinates from file (coordinates are copied so that they can be safely modified)
+    """
+    stat = os.stat(fpath)
+    header, coords = _read_airfoil(fpath, stat.st_mtime_ns, stat.st_size)
+    return header, coords.copy()
+
+@functools.lru_cache(maxsize=128)
+def _read_airfoil(fpath, mtime, size):
+    """Read airfoil file in a single call and parse header and coordinates from memory (cached by path, modification time and size)
+    """
+    with open(fpath) as file:
+        buf = file.read()
+    header, _, data = buf.partition('\n')
+    return header.strip(), np.loadtxt(io.StringIO(data))
+
+def _save_airfoil(fname, header, coords):
+    """Write airfoil header and coordinates to file, formatting all coordinates at once
+    """
+    n_row, n_col = coords.shape
+    row_fmt = ' '.join(['%1.5e'] * n_col) + '\n'
+    with open(fname, 'w') as file:
+        file.write(f'# {header}\n' + (row_fmt * n_row) % tuple(coords.ravel()))
 
 def compute_wing_cfg(spans, tapers, sweeps, dihedrals, root_chord):
     """Compute the leading edge coordinates and the chord length of the airfoil at the tip of each planform
@@ -39,16 +77,15 @@ def compute_wing_cfg(spans, tapers, sweeps, dihedrals, root_chord):
     chords: list of float
         chord lengths
     """
-    le_coords = [[0., 0., 0.]]
-    chords = [root_chord]
-    for i in range(len(spans)):
-        lec = [0., 0., 0.]
-        lec[0] = le_coords[i][0] + np.tan(sweeps[i] * np.pi / 180) * spans[i]
-        lec[1] = le_coords[i][1] + spans[i]
-        lec[2] = le_coords[i][2] + np.tan(dihedrals[i] * np.pi / 180) * spans[i]
-        le_coords.append(lec)
-        chords.append(chords[i] * tapers[i])
-    return le_coords, chords
+    spans = np.asarray(spans, dtype=float)
+    # Leading edge offsets of each planform, accumulated from the root
+    deltas = np.column_stack((np.tan(np.asarray(sweeps) * np.pi / 180) * spans,
+                              spans,
+                              np.tan(np.asarray(dihedrals) * np.pi / 180) * spans))
+    le_coords = np.cumsum(np.vstack((np.zeros(3), deltas)), axis=0)
+    # Chord lengths, obtained by successively applying the taper ratios
+    chords = np.cumprod(np.concatenate(([root_chord], tapers)))
+    return le_coords.tolist(), chords.tolist()
 
 def compute_ff_mesh_size(surface_size, domain_length, factor):
     """Compute the mesh size at the farfield boundary
@@ -65,10 +102,10 @@ def compute_ff_mesh_size(surface_size, domain_length, factor):
     _: float
         mesh size at farfield boundary
     """
-    n = np.log(1 - (1 - factor) * domain_length / surface_size) / np.log(factor)
-    return surface_size * pow(factor, n - 1)
+    # size of the last cell of the geometric progression, s * f^(n-1) with f^n = 1 + (f - 1) * L / s
+    return (surface_size + (factor - 1) * domain_length) / factor
 
-def add_section(le_coords, chords, incidences, airf_path, y_sec=0.99):
+def add_section(le_coords, chords, incidences, airf_path, y_sec=0.99, method='pchip'):
     """Add a section to the wing planform
 
     Parameters:
@@ -82,6 +119,8 @@ def add_section(le_coords, chords, incidences, airf_path, y_sec=0.99):
         path to files containing airfoil coordinates of each cross-section
     y_sec: float
         normalized y-coordinate of cross-section to add (between 0 and 1)
+    method: str
+        method used to interpolate airfoil coordinates ('pchip' or 'linear')
 
     Return:
     le_coords: list of list of float
@@ -112,10 +151,9 @@ def add_section(le_coords, chords, incidences, airf_path, y_sec=0.99):
     airfoil_coords = []
     for ipth in [isec - 1, isec]:
         fnames.append(os.path.basename(airf_path[ipth]).split('.')[0])
-        file = open(airf_path[ipth])
-        header.append(file.readline().strip())
-        file.close()
-        airfoil_coords.append(np.loadtxt(airf_path[ipth], skiprows=1))
+        hdr, coords = _load_airfoil(airf_path[ipth])
+        header.append(hdr)
+        airfoil_coords.append(coords)
 
     # Compute interpolation parameter
     a = (y - le_coords[isec - 1][1]) / (le_coords[isec][1] - le_coords[isec - 1][1])
@@ -123,7 +161,7 @@ def add_section(le_coords, chords, incidences, airf_path, y_sec=0.99):
     if le_coords[isec - 1][0] == le_coords[isec][0] and le_coords[isec - 1][2] == le_coords[isec][2]:
         new_le_coords = [le_coords[isec - 1][0], y, le_coords[isec - 1][2]]
     else:
-        new_le_coords = list((1 - a) * np.array(le_coords[isec - 1]) + a * np.array(le_coords[isec]))
+        new_le_coords = [(1 - a) * p + a * q for p, q in zip(le_coords[isec - 1], le_coords[isec])]
     # Interpolate chord length
     if chords[isec - 1] == chords[isec]:
         new_chord = chords[isec - 1]
@@ -138,9 +176,20 @@ def add_section(le_coords, chords, incidences, airf_path, y_sec=0.99):
     if fnames[0] == fnames[1]:
         new_fpath = airf_path[0]
     else:
-        new_airfoil_coords = (1 - a) * interpolate_coords(airfoil_coords[0]) + a * interpolate_coords(airfoil_coords[1])
+        c0, c1 = airfoil_coords
+        if c0.shape == c1.shape and np.array_equal(c0[:, 0], c1[:, 0]):
+            # Airfoils share the same x-coordinates, blend y-coordinates directly
+            new_airfoil_coords = c0
+            new_airfoil_coords[:, 1] *= 1 - a
+            new_airfoil_coords[:, 1] += a * c1[:, 1]
+        else:
+            n_pts = 80 # number of interpolation points along x-axis
+            y_new = _interpolate_y(c0, n_pts, method)
+            y_new *= 1 - a
+            y_new += a * _interpolate_y(c1, n_pts, method)
+            new_airfoil_coords = np.column_stack((_cosine_grid(n_pts)[1], y_new))
         new_fname = f'{fnames[0]}_{fnames[1]}.dat'
-        np.savetxt(new_fname, new_airfoil_coords, fmt='%1.5e', header=f'{header[0]} - {header[1]}')
+        _save_airfoil(new_fname, f'{header[0]} - {header[1]}', new_airfoil_coords)
         new_fpath = os.path.join(os.getcwd(), new_fname)
 
     # Add new section to lists
@@ -150,7 +199,7 @@ def add_section(le_coords, chords, incidences, airf_path, y_sec=0.99):
     airf_path.insert(isec, new_fpath)
     return le_coords, chords, incidences, airf_path
 
-def interpolate_coords(coords, n_pts=80, flip=False):
+def interpolate_coords(coords, n_pts=80, flip=False, method='pchip'):
     """Interpolate coordinates
 
     Parameters:
@@ -160,6 +209,8 @@ def interpolate_coords(coords, n_pts=80, flip=False):
         number of interpolation points along x-axis
     flip: bool
         whether to reverse order of coordinates along x-axis
+    method: str
+        interpolation method, 'pchip' (shape-preserving cubic) or 'linear' (faster)
 
     Return:
     new_coords: ndarray
@@ -169,22 +220,58 @@ def interpolate_coords(coords, n_pts=80, flip=False):
     if flip:
         coords = np.flipud(coords)
 
-    # Split suction and pressure sides
-    le = np.argmin(coords[:, 0])
-    x_u = coords[:le+1, 0]
-    y_u = coords[:le+1, 1]
-    x_l = coords[le:, 0]
-    y_l = coords[le:, 1]
-
     # Interpolate using half-cosine spacing
+    return np.column_stack((_cosine_grid(n_pts)[1], _interpolate_y(coords, n_pts, method)))
+
+def _interpolate_y(coords, n_pts, method):
+    """Interpolate the y-coordinates of the suction and pressure sides on the half-cosine grid, and concatenate them removing duplicated LE
+    """
+    coords = np.asarray(coords, dtype=float)
+    if method == 'pchip':
+        y_u_new, y_l_new = _sample_pchip(coords.tobytes(), coords.shape, n_pts)
+    elif method == 'linear':
+        x_new = _cosine_grid(n_pts)[0]
+        x_u, y_u, x_l, y_l = _split_sides(coords)
+        y_u_new = np.interp(x_new, x_u, y_u)
+        y_l_new = np.interp(x_new, x_l, y_l)
+    else:
+        raise RuntimeError('interpolate_coords: Parameter "method" must be either "pchip" or "linear"!\n')
+    return np.hstack((np.flipud(y_u_new[1:]), y_l_new))
+
+@functools.lru_cache(maxsize=16)
+def _cosine_grid(n_pts):
+    """Compute the half-cosine spaced x-coordinates of one side, and of both sides without duplicated LE (cached by number of points)
+    """
     x_new = 0.5 * (1 - np.cos(np.linspace(0., np.pi, n_pts)))
-    y_u_new = PchipInterpolator(np.flipud(x_u), np.flipud(y_u))(x_new)
-    y_l_new = PchipInterpolator(x_l, y_l)(x_new)
+    x_all = np.hstack((np.flipud(x_new[1:]), x_new))
+    x_new.flags.writeable = False
+    x_all.flags.writeable = False
+    return x_new, x_all
 
-    # Concatenate and remove duplicated LE
-    new_coords = np.vstack((np.hstack((np.flipud(x_new[1:]), x_new)),
-                            np.hstack((np.flipud(y_u_new[1:]), y_l_new))))
-    return new_coords.T
+@functools.lru_cache(maxsize=64)
+def _sample_pchip(coords_bytes, shape, n_pts):
+    """Evaluate the interpolants of the suction and pressure sides of an airfoil on the half-cosine grid (cached by coordinates and number of points)
+    """
+    pchip_u, pchip_l = _build_pchip(coords_bytes, shape)
+    x_new = _cosine_grid(n_pts)[0]
+    y_u_new = pchip_u(x_new)
+    y_l_new = pchip_l(x_new)
+    y_u_new.flags.writeable = False
+    y_l_new.flags.writeable = False
+    return y_u_new, y_l_new
+
+@functools.lru_cache(maxsize=64)
+def _build_pchip(coords_bytes, shape):
+    """Build the interpolants of the suction and pressure sides of an airfoil (cached by coordinates)
+    """
+    x_u, y_u, x_l, y_l = _split_sides(np.frombuffer(coords_bytes, dtype=float).reshape(shape))
+    return PchipInterpolator(x_u, y_u), PchipInterpolator(x_l, y_l)
+
+def _split_sides(coords):
+    """Split airfoil coordinates into suction and pressure sides, both ordered from leading to trailing edge
+    """
+    le = np.argmin(coords[:, 0])
+    return np.flipud(coords[:le+1, 0]), np.flipud(coords[:le+1, 1]), coords[le:, 0], coords[le:, 1]
 
 def sharpen_te(fpath, n_change=10, gui=False):
     """Convert a blunt trailing edge to a sharp trailing edge and write coordinates
@@ -198,22 +285,21 @@ def sharpen_te(fpath, n_change=10, gui=False):
         whether to display the airfoil
     """
     # Read header and coordinates
-    file = open(fpath)
-    header = file.readline().strip()
-    file.close()
-    coords = np.loadtxt(fpath, skiprows=1)
+    header, coords = _load_airfoil(fpath)
     new_coords = coords.copy()
 
-    # Convert blunt TE to sharp TE
-    z_mean = (coords[0:n_change, 1] + coords[-1:-n_change-1:-1, 1]) / 2
-    tck = (coords[0:n_change, 1] - coords[-1:-n_change-1:-1, 1]) / 2
-    new_tck = np.linspace(0, tck[-1], n_change)
-    new_coords[0:n_change, 1] = z_mean + new_tck;
-    new_coords[-1:-n_change-1:-1, 1] = z_mean - new_tck;
+    # Convert blunt TE to sharp TE (upper and lower points are paired from the TE)
+    z_up = np.ascontiguousarray(coords[:n_change, 1])
+    z_lw = np.ascontiguousarray(coords[-n_change:, 1][::-1])
+    z_mean = z_up + z_lw
+    z_mean *= 0.5
+    new_tck = np.linspace(0, 0.5 * (z_up[-1] - z_lw[-1]), n_change)
+    new_coords[:n_change, 1] = z_mean + new_tck
+    new_coords[-n_change:, 1] = (z_mean - new_tck)[::-1]
 
     # Write file
     fname = os.path.basename(fpath).split('.')[0] + '_ste.dat'
-    np.savetxt(fname, new_coords, fmt='%1.5e', header=header + ' sharp TE')
+    _save_airfoil(fname, header + ' sharp TE', new_coords)
 
     # Display
     if gui:
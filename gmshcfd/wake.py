@@ -48,37 +48,31 @@ class Wake:
         """Create wake points, curves and surfaces in Gmsh model
         """
         # Retain points and curves needed to build wake
+        all_tags = list(pte_ids.keys())
+        all_coords = list(pte_ids.values())
         if merge == 'all':
-            pte_tags = [list(pte_ids.keys())[0], list(pte_ids.keys())[-1]]
-            pte_coords = [list(pte_ids.values())[0], list(pte_ids.values())[-1]]
+            pte_tags = [all_tags[0], all_tags[-1]]
+            pte_coords = [all_coords[0], all_coords[-1]]
             cte_tags = [[-i for i in cte_ids]]
         elif merge == 'last':
-            pte_tags = [*list(pte_ids.keys())[:-2], list(pte_ids.keys())[-1]]
-            pte_coords = [*list(pte_ids.values())[:-2], list(pte_ids.values())[-1]]
+            pte_tags = [*all_tags[:-2], all_tags[-1]]
+            pte_coords = [*all_coords[:-2], all_coords[-1]]
             cte_tags = [*[[-i] for i in cte_ids[:-2]], [-cte_ids[-2], -cte_ids[-1]]]
         else:
-            pte_tags = list(pte_ids.keys())
-            pte_coords = list(pte_ids.values())
+            pte_tags = all_tags
+            pte_coords = all_coords
             cte_tags = [[-i] for i in cte_ids]
 
+        geo = gmsh.model.geo
         # Create points
-        ptags = []
-        for te_coord in pte_coords:
-            ptags.append(gmsh.model.geo.add_point(wake_length, te_coord[1], te_coord[2]))
+        ptags = [geo.add_point(wake_length, te_coord[1], te_coord[2]) for te_coord in pte_coords]
 
         # Create curves
-        shed_ctags = []
-        for i, te_tag in enumerate(pte_tags):
-            shed_ctags.append(gmsh.model.geo.add_line(te_tag, ptags[i]))
-        trail_ctags = []
-        for i in range(len(ptags) - 1):
-            trail_ctags.append(gmsh.model.geo.add_line(ptags[i], ptags[i+1]))
+        shed_ctags = [geo.add_line(te_tag, ptags[i]) for i, te_tag in enumerate(pte_tags)]
+        trail_ctags = [geo.add_line(ptags[i], ptags[i+1]) for i in range(len(ptags) - 1)]
 
         # Create surfaces
-        stags = []
-        for i in range(len(cte_tags)):
-            cltag = gmsh.model.geo.add_curve_loop([trail_ctags[i], -shed_ctags[i+1], *cte_tags[i], shed_ctags[i]])
-            stags.append(gmsh.model.geo.add_plane_surface([cltag]))
+        stags = [geo.add_plane_surface([geo.add_curve_loop([trail_ctags[i], -shed_ctags[i+1], *cte_tags[i], shed_ctags[i]])]) for i in range(len(cte_tags))]
 
         # Add physical groups
         gmsh.model.geo.synchronize()
@@ -86,8 +80,7 @@ class Wake:
         gmsh.model.add_physical_group(2, stags, name=name)
 
         # Add meshing constraints
-        for i in range(len(ptags)):
-            gmsh.model.mesh.set_size([(0, ptags[i])], mesh_size)
+        gmsh.model.mesh.set_size([(0, tag) for tag in ptags], mesh_size)
 
         # Create tag dictionary
         self.tags = {'symmetry_point': ptags[0],
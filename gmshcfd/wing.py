@@ -16,6 +16,8 @@
 
 from .wake import Wake
 from .errors import GmshCFDError
+from .utils import load_airfoil
+from concurrent.futures import ThreadPoolExecutor
 import gmsh
 import numpy as np
 
@@ -36,18 +38,27 @@ class Wing:
     height: float
         z_coordinate of the airfoil trailing edge on the symmetry plane
     wake: gmshcfd.Wake object
-        wake attached to the lifting surface
+        wake attached to the lifting surface (available after create_model)
     tags: dict
-        gmsh tags of remarkable curves/surfaces of the lifting surface
+        gmsh tags of remarkable curves/surfaces of the lifting surface (available after create_model)
     """
     def __init__(self, name, cfg, domain_cfg, mesh_cfg):
+        # Initialize attributes
+        self.__name = name
+        self.__domain_cfg = domain_cfg
+        self.__mesh_cfg = mesh_cfg
         # Compute airfoil coordinates
-        is_closed, n_airf, coords, le_idx, tp_idx = self.__compute_coordinates(cfg, domain_cfg)
-        # Create Gmsh wing and wake models
+        self.__geometry = self.__compute_coordinates(cfg, domain_cfg)
+
+    def create_model(self):
+        """Create wing and wake in Gmsh model from the airfoil coordinates (Gmsh API is not thread-safe, must be called sequentially)
+        """
+        is_closed, n_airf, coords, le_idx, tp_idx = self.__geometry
         if is_closed:
-            self.__create_model_closed(n_airf, coords, le_idx, name, domain_cfg, mesh_cfg)
+            self.__create_model_closed(n_airf, coords, le_idx, self.__name, self.__domain_cfg, self.__mesh_cfg)
         else:
-            self.__create_model_open(n_airf, coords, le_idx, tp_idx, name, domain_cfg, mesh_cfg)
+            self.__create_model_open(n_airf, coords, le_idx, tp_idx, self.__name, self.__domain_cfg, self.__mesh_cfg)
+        self.__geometry = None
 
     def __compute_coordinates(self, cfg, domain_cfg):
         """Read airfoil coordinates from files and transform them using wing planform configuration
@@ -55,18 +66,18 @@ class Wing:
         # Get number of airfoils
         n_airf = len(cfg['airfoils'])
 
-        # Read coordinates
-        coords = []
-        for fname in cfg['airfoils']:
-            coords.append(np.loadtxt(fname, skiprows=1))
+        # Read coordinates (files are independent, so they are read concurrently)
+        with ThreadPoolExecutor(max_workers=min(8, n_airf)) as executor:
+            coords = list(executor.map(load_airfoil, cfg['airfoils']))
         # Find local index of leading edge point
-        le_idx = []
-        for c in coords:
-            le_idx.append(np.argmin(c[:, 0]))
+        if all(c.shape == coords[0].shape for c in coords):
+            le_idx = np.argmin(np.stack([c[:, 0] for c in coords]), axis=1).tolist()
+        else:
+            le_idx = [int(np.argmin(c[:, 0])) for c in coords]
         # Find local index of c/20 point at tip
         tp_idx = np.argmin(abs(coords[-1][:, 0] - 0.05))
 
-        # Transform airfoil coordinates using chord length, incidence and offset
+        # Check and reorder airfoil coordinates
         for i in range(n_airf):
             # Check if TE is duplicated and if x-coordinate is 1
             if coords[i][0][0] != 1.0 or coords[i][-1][0] != 1.0:
@@ -75,7 +86,7 @@ class Wing:
             if coords[i][1, 1] < coords[i][-2, 1]:
                 coords[i] = np.flipud(coords[i])
             # Check if airfoil is closed or open
-            if coords[i][0][1] == coords[i][-1][1]:
+            if np.array_equal(coords[i][0], coords[i][-1]):
                 is_closed = True
                 if domain_cfg['type'] == 'rans':
                     raise GmshCFDError('sharp trailing edge airfoils cannot be used with extruded boundary layers (rans domain type)!\n', self)
@@ -84,18 +95,27 @@ class Wing:
                 is_closed = False
                 if domain_cfg['type'] == 'potential':
                     raise GmshCFDError('blunt trailing edge airfoils cannot be used with wakes (potential domain type)!\n', self)
-            # Scale according to chord length
-            coords[i] *= cfg['chords'][i]
-            # Rotate around quarter-chord according to incidence angle
-            cos = np.cos(cfg['incidences'][i] * np.pi / 180)
-            sin = np.sin(cfg['incidences'][i] * np.pi / 180)
-            coords[i] = np.dot(coords[i], np.array([[cos, -sin],[sin, cos]]))
-            # Add x and z offset
-            coords[i][:, 0] += cfg['le_offsets'][i][0] + cfg['offset'][0]
-            coords[i][:, 1] += cfg['le_offsets'][i][2] + cfg['offset'][1]
-            # Insert y-coordinates
-            coords[i] = np.hstack((coords[i], cfg['le_offsets'][i][1] * np.ones([coords[i].shape[0], 1])))
-            coords[i][:, [1, 2]] = np.fliplr(coords[i][:, [1, 2]])
+
+        # Transform airfoil coordinates using chord length, incidence and offset (all airfoils at once)
+        n_pts = [c.shape[0] for c in coords]
+        chords = np.repeat(np.asarray(cfg['chords'][:n_airf], dtype=float), n_pts)
+        angles = np.asarray(cfg['incidences'][:n_airf], dtype=float) * np.pi / 180
+        cos = np.repeat(np.cos(angles), n_pts)
+        sin = np.repeat(np.sin(angles), n_pts)
+        offsets = np.repeat(np.asarray(cfg['le_offsets'][:n_airf], dtype=float), n_pts, axis=0)
+        xz = np.concatenate(coords)
+        # Scale according to chord length
+        x = xz[:, 0] * chords
+        z = xz[:, 1] * chords
+        # Rotate around quarter-chord according to incidence angle, and add x and z offset
+        tcoords = np.empty((xz.shape[0], 3))
+        tcoords[:, 0] = x * cos + z * sin
+        tcoords[:, 0] += offsets[:, 0] + cfg['offset'][0]
+        tcoords[:, 2] = z * cos - x * sin
+        tcoords[:, 2] += offsets[:, 2] + cfg['offset'][1]
+        # Insert y-coordinates
+        tcoords[:, 1] = offsets[:, 1]
+        coords = np.split(tcoords, np.cumsum(n_pts)[:-1])
 
         # Get the trailing edge z_coordinate of the airfoil on the symmetry plane
         self.height = coords[0][0, 0]
@@ -105,40 +125,33 @@ class Wing:
     def __create_model_closed(self, n_airf, coords, le_idx, name, domain_cfg, mesh_cfg):
         """Create points, curves and surfaces for wing with sharp trailing edge in Gmsh model
         """
+        geo = gmsh.model.geo
         # Add airfoil points
-        ptags = []
-        for c in coords:
-            ptag = []
-            for row in c:
-                ptag.append(gmsh.model.geo.add_point(row[0], row[1], row[2]))
-            ptags.append(ptag)
+        ptags = [[geo.add_point(x, y, z) for x, y, z in c.tolist()] for c in coords]
 
         # Add airfoils splines
         airf_ctags = []
         for i in range(n_airf):
-            ctag_up = gmsh.model.geo.add_spline(ptags[i][0:le_idx[i]+1])
-            ctag_lw = gmsh.model.geo.add_spline(np.append(ptags[i][le_idx[i]:], ptags[i][0]))
+            ctag_up = geo.add_spline(ptags[i][0:le_idx[i]+1])
+            ctag_lw = geo.add_spline(ptags[i][le_idx[i]:] + [ptags[i][0]])
             airf_ctags.append([ctag_up, ctag_lw])
         # Add TE and LE lines
         plan_ctags = []
         for i in range(n_airf - 1):
-            ctag_te = gmsh.model.geo.add_line(ptags[i][0], ptags[i+1][0])
-            ctag_le = gmsh.model.geo.add_line(ptags[i][le_idx[i]], ptags[i+1][le_idx[i+1]])
+            ctag_te = geo.add_line(ptags[i][0], ptags[i+1][0])
+            ctag_le = geo.add_line(ptags[i][le_idx[i]], ptags[i+1][le_idx[i+1]])
             plan_ctags.append([ctag_te, ctag_le])
 
-        # Add planforms
-        stags = []
-        for i in range(n_airf - 1):
-            cltag = gmsh.model.geo.add_curve_loop([airf_ctags[i][0], plan_ctags[i][1], -airf_ctags[i+1][0], -plan_ctags[i][0]])
-            stags.append(gmsh.model.geo.add_surface_filling([-cltag]))
-            cltag = gmsh.model.geo.add_curve_loop([airf_ctags[i][1], plan_ctags[i][0], -airf_ctags[i+1][1], -plan_ctags[i][1]])
-            stags.append(gmsh.model.geo.add_surface_filling([-cltag]))
+        # Add planforms (upper and lower side of each planform)
+        loops = [loop for i in range(n_airf - 1) for loop in ([airf_ctags[i][0], plan_ctags[i][1], -airf_ctags[i+1][0], -plan_ctags[i][0]],
+                                                              [airf_ctags[i][1], plan_ctags[i][0], -airf_ctags[i+1][1], -plan_ctags[i][1]])]
+        stags = [geo.add_surface_filling([-geo.add_curve_loop(loop)]) for loop in loops]
         # Add cutoff wingtip
-        cltag = gmsh.model.geo.add_curve_loop([airf_ctags[-1][0], airf_ctags[-1][1]])
-        stags.append(gmsh.model.geo.add_plane_surface([-cltag]))
+        cltag = geo.add_curve_loop([airf_ctags[-1][0], airf_ctags[-1][1]])
+        stags.append(geo.add_plane_surface([-cltag]))
 
         # Add physical groups
-        gmsh.model.geo.synchronize()
+        geo.synchronize()
         if domain_cfg['type'] == 'potential':
             gmsh.model.add_physical_group(1, [tags[0] for tags in plan_ctags], name=name+'Te')
             gmsh.model.add_physical_group(2, stags[0::2], name=name)
@@ -147,9 +160,8 @@ class Wing:
             gmsh.model.add_physical_group(2, stags, name=name)
 
         # Add meshing constraint on TE and LE
-        for i in range(n_airf):
-            gmsh.model.mesh.set_size([(0, ptags[i][0])], mesh_cfg['wing_sizes'][name]['te'][i])
-            gmsh.model.mesh.set_size([(0, ptags[i][le_idx[i]])], mesh_cfg['wing_sizes'][name]['le'][i])
+        sizes = mesh_cfg['wing_sizes'][name]
+        self.__set_sizes([(ptags[i][0], sizes['te'][i]) for i in range(n_airf)] + [(ptags[i][le_idx[i]], sizes['le'][i]) for i in range(n_airf)])
 
         # Generate tag dictionary
         self.tags = {'symmetry_curves': airf_ctags[0], 'wing_surfaces': stags}
@@ -158,7 +170,7 @@ class Wing:
         if domain_cfg['type'] == 'potential':
             pte_ids = {} # TE point
             for i in range(n_airf):
-                pte_ids[ptags[i][0]] = coords[i][0]
+                pte_ids[ptags[i][0]] = tuple(coords[i][0].tolist())
             cte_ids = [] # TE curves
             for i in range(n_airf - 1):
                 cte_ids.append(plan_ctags[i][0])
@@ -167,13 +179,9 @@ class Wing:
     def __create_model_open(self, n_airf, coords, le_idx, tp_idx, name, domain_cfg, mesh_cfg):
         """Create points, curves and surfaces for wing with blunt trailing edge in Gmsh model
         """
+        geo = gmsh.model.geo
         # Add airfoil points
-        ptags = []
-        for c in coords:
-            ptag = []
-            for row in c:
-                ptag.append(gmsh.model.geo.add_point(row[0], row[1], row[2]))
-            ptags.append(ptag)
+        ptags = [[geo.add_point(x, y, z) for x, y, z in c.tolist()] for c in coords]
         # Add trailing edge and tip points and centers for blunt TE
         if domain_cfg['type'] == 'rans':
             # TE and TE center
@@ -181,92 +189,83 @@ class Wing:
             te_ptags = []
             for i in range(n_airf):
                 c_coord = [0.5 * (coords[i][0, 0] + coords[i][-1, 0]), coords[i][0, 1], 0.5 * (coords[i][0, 2] + coords[i][-1, 2])]
-                tec_ptags.append(gmsh.model.geo.add_point(c_coord[0], c_coord[1], c_coord[2]))
-                te = gmsh.model.geo.copy([(0, ptags[i][0])])
-                gmsh.model.geo.rotate(te, c_coord[0], c_coord[1], c_coord[2], 0, 1, 0, np.pi / 2)
-                te_ptags.append(te[0][1])
+                tec_ptags.append(geo.add_point(c_coord[0], c_coord[1], c_coord[2]))
+                # Rotate upper TE point by 90 degrees around y-axis through TE center
+                te_ptags.append(geo.add_point(c_coord[0] + (coords[i][0, 2] - c_coord[2]), coords[i][0, 1], c_coord[2] - (coords[i][0, 0] - c_coord[0])))
             # Tip
-            tip_ptags = []
-            for i in range(1, 10):
-                idx = tp_idx * i // 9
-                xc = 0.5 * (coords[-1][idx, 0] + coords[-1][-idx-1, 0])
-                zc = 0.5 * (coords[-1][idx, 2] + coords[-1][-idx-1, 2])
-                yc = coords[-1][idx, 1] + 0.5 * abs(coords[-1][idx, 2] - coords[-1][-idx-1, 2])
-                tip_ptags.append(gmsh.model.geo.add_point(xc, yc, zc))
+            idx = tp_idx * np.arange(1, 10) // 9
+            up = coords[-1][idx]
+            lw = coords[-1][-idx-1]
+            xc = 0.5 * (up[:, 0] + lw[:, 0])
+            zc = 0.5 * (up[:, 2] + lw[:, 2])
+            yc = up[:, 1] + 0.5 * np.abs(up[:, 2] - lw[:, 2])
+            tip_ptags = [geo.add_point(x, y, z) for x, y, z in zip(xc.tolist(), yc.tolist(), zc.tolist())]
 
         # Add airfoils splines
         airf_ctags = []
         for i in range(n_airf):
-            ctag_up = gmsh.model.geo.add_spline(ptags[i][0:le_idx[i]+1])
-            ctag_lw = gmsh.model.geo.add_spline(ptags[i][le_idx[i]:])
+            ctag_up = geo.add_spline(ptags[i][0:le_idx[i]+1])
+            ctag_lw = geo.add_spline(ptags[i][le_idx[i]:])
             airf_ctags.append([ctag_up, ctag_lw])
         # Add TE and LE lines
         plan_ctags = []
         for i in range(n_airf - 1):
-            ctag_teu = gmsh.model.geo.add_line(ptags[i][0], ptags[i+1][0])
-            ctag_le = gmsh.model.geo.add_line(ptags[i][le_idx[i]], ptags[i+1][le_idx[i+1]])
-            ctag_tel = gmsh.model.geo.add_line(ptags[i][-1], ptags[i+1][-1])
+            ctag_teu = geo.add_line(ptags[i][0], ptags[i+1][0])
+            ctag_le = geo.add_line(ptags[i][le_idx[i]], ptags[i+1][le_idx[i+1]])
+            ctag_tel = geo.add_line(ptags[i][-1], ptags[i+1][-1])
             plan_ctags.append([ctag_teu, ctag_le, ctag_tel])
         # Add trailing edge curves and tip spline
         if domain_cfg['type'] == 'rans':
             # TE airfoil circles
             airf_te_ctags = []
             for i in range(n_airf):
-                ctag_teu = gmsh.model.geo.add_circle_arc(te_ptags[i], tec_ptags[i], ptags[i][0])
-                ctag_tel = gmsh.model.geo.add_circle_arc(ptags[i][-1], tec_ptags[i], te_ptags[i])
+                ctag_teu = geo.add_circle_arc(te_ptags[i], tec_ptags[i], ptags[i][0])
+                ctag_tel = geo.add_circle_arc(ptags[i][-1], tec_ptags[i], te_ptags[i])
                 airf_te_ctags.append([ctag_teu, ctag_tel])
             # TE planform line
             te_ctags = []
             for i in range(n_airf-1):
-                te_ctags.append(gmsh.model.geo.add_line(te_ptags[i], te_ptags[i+1]))
+                te_ctags.append(geo.add_line(te_ptags[i], te_ptags[i+1]))
             # Tip
-            tip_ctag = gmsh.model.geo.add_spline([te_ptags[-1]] + tip_ptags)
-            tip_le_ctag = gmsh.model.geo.add_line(tip_ptags[-1], ptags[-1][le_idx[-1]])
+            tip_ctag = geo.add_spline([te_ptags[-1]] + tip_ptags)
+            tip_le_ctag = geo.add_line(tip_ptags[-1], ptags[-1][le_idx[-1]])
         else:
             # TE line
             airf_te_ctags = []
             for i in range(n_airf):
-                airf_te_ctags.append(gmsh.model.geo.add_line(ptags[i][-1], ptags[i][0]))
+                airf_te_ctags.append(geo.add_line(ptags[i][-1], ptags[i][0]))
 
-        # Add planforms
-        stags = []
-        for i in range(n_airf - 1):
-            cltag = gmsh.model.geo.add_curve_loop([airf_ctags[i][0], plan_ctags[i][1], -airf_ctags[i+1][0], -plan_ctags[i][0]])
-            stags.append(gmsh.model.geo.add_surface_filling([-cltag]))
-            cltag = gmsh.model.geo.add_curve_loop([airf_ctags[i][1], plan_ctags[i][2], -airf_ctags[i+1][1], -plan_ctags[i][1]])
-            stags.append(gmsh.model.geo.add_surface_filling([-cltag]))
+        # Add planforms (upper and lower side of each planform)
+        loops = [loop for i in range(n_airf - 1) for loop in ([airf_ctags[i][0], plan_ctags[i][1], -airf_ctags[i+1][0], -plan_ctags[i][0]],
+                                                              [airf_ctags[i][1], plan_ctags[i][2], -airf_ctags[i+1][1], -plan_ctags[i][1]])]
+        stags = [geo.add_surface_filling([-geo.add_curve_loop(loop)]) for loop in loops]
         # Add TE and wingtip
         if domain_cfg['type'] == 'rans':
             # Rounded TE
-            for i in range(n_airf - 1):
-                cltag = gmsh.model.geo.add_curve_loop([airf_te_ctags[i][0], plan_ctags[i][0], -airf_te_ctags[i+1][0], -te_ctags[i]])
-                stags.append(gmsh.model.geo.add_surface_filling([-cltag]))
-                cltag = gmsh.model.geo.add_curve_loop([airf_te_ctags[i][1], te_ctags[i], -airf_te_ctags[i+1][1], -plan_ctags[i][2]])
-                stags.append(gmsh.model.geo.add_surface_filling([-cltag]))
+            loops = [loop for i in range(n_airf - 1) for loop in ([airf_te_ctags[i][0], plan_ctags[i][0], -airf_te_ctags[i+1][0], -te_ctags[i]],
+                                                                  [airf_te_ctags[i][1], te_ctags[i], -airf_te_ctags[i+1][1], -plan_ctags[i][2]])]
+            stags += [geo.add_surface_filling([-geo.add_curve_loop(loop)]) for loop in loops]
             # Rounded wingtip
-            cltag = gmsh.model.geo.add_curve_loop([airf_ctags[-1][0], -tip_le_ctag, -tip_ctag, airf_te_ctags[-1][0]])
-            stags.append(gmsh.model.geo.add_surface_filling([-cltag]))
-            cltag = gmsh.model.geo.add_curve_loop([airf_te_ctags[-1][1], tip_ctag, tip_le_ctag, airf_ctags[-1][1]])
-            stags.append(gmsh.model.geo.add_surface_filling([-cltag]))
+            cltag = geo.add_curve_loop([airf_ctags[-1][0], -tip_le_ctag, -tip_ctag, airf_te_ctags[-1][0]])
+            stags.append(geo.add_surface_filling([-cltag]))
+            cltag = geo.add_curve_loop([airf_te_ctags[-1][1], tip_ctag, tip_le_ctag, airf_ctags[-1][1]])
+            stags.append(geo.add_surface_filling([-cltag]))
         else:
             # Cutoff TE
-            for i in range(n_airf - 1):
-                cltag = gmsh.model.geo.add_curve_loop([airf_te_ctags[i], plan_ctags[i][0], -airf_te_ctags[i+1], -plan_ctags[i][2]])
-                stags.append(gmsh.model.geo.add_plane_surface([-cltag]))
+            loops = [[airf_te_ctags[i], plan_ctags[i][0], -airf_te_ctags[i+1], -plan_ctags[i][2]] for i in range(n_airf - 1)]
+            stags += [geo.add_plane_surface([-geo.add_curve_loop(loop)]) for loop in loops]
             # Cutoff wingtip
-            cltag = gmsh.model.geo.add_curve_loop([airf_ctags[-1][0], airf_ctags[-1][1], airf_te_ctags[-1]])
-            stags.append(gmsh.model.geo.add_plane_surface([-cltag]))
+            cltag = geo.add_curve_loop([airf_ctags[-1][0], airf_ctags[-1][1], airf_te_ctags[-1]])
+            stags.append(geo.add_plane_surface([-cltag]))
 
         # Add boundary layer
         if domain_cfg['type'] == 'rans':
             # Extrude surfaces to create boundary layer
             N = mesh_cfg['boundary_layer']['wing']['num_layer'] # number of layers
             r = mesh_cfg['boundary_layer']['wing']['growth_ratio'] # ratio
-            d = [mesh_cfg['boundary_layer']['wing']['hgt_first_layer']] # heigth of first layer
-            for i in range(1, N):
-                d.append(d[-1] + d[0] * r**i)
-            bl = gmsh.model.geo.extrudeBoundaryLayer([(2, tag) for tag in stags], [1] * N, d, True)
-            gmsh.model.geo.synchronize()
+            h = mesh_cfg['boundary_layer']['wing']['hgt_first_layer'] # heigth of first layer
+            d = np.cumsum(h * r**np.arange(N)).tolist() # cumulated heigth of each layer (geometric series)
+            bl = geo.extrudeBoundaryLayer([(2, tag) for tag in stags], [1] * N, d, True)
             # Get tags of top and symmetry surfaces, and volume
             bl_top_stags = []
             bl_sym_stags = []
@@ -279,6 +278,10 @@ class Wing:
                     if i < 12:
                         bl_sym_stags.append(bl[i + 4])
                         bl_sym_stags.append(bl[2 * (n_airf - 1) * 6 + i + 4])
+
+        # Synchronize model once all entities have been created
+        geo.synchronize()
+        if domain_cfg['type'] == 'rans':
             # Get the bounding curves on symmetry plane, gives 2 closed countours (inner and outer), so remove inner
             bl_sym_ctags = [c[1] for c in gmsh.model.getBoundary(bl_sym_stags)]
             for i in range(2):
@@ -286,7 +289,6 @@ class Wing:
                 bl_sym_ctags.remove(-airf_te_ctags[0][i])
 
         # Add physical groups
-        gmsh.model.geo.synchronize()
         gmsh.model.add_physical_group(2, stags, name=name)
         if domain_cfg['type'] == 'rans' and mesh_cfg['boundary_layer']['write_tags']:
             gmsh.model.add_physical_group(2, bl_top_stags, tag=9998, name=name+'BoundaryLayerSurface')
@@ -299,34 +301,34 @@ class Wing:
             # Suction and pressure side curves
             for tags in airf_ctags:
                 for j in range(2):
-                    gmsh.model.geo.mesh.set_transfinite_curve(tags[j], mesh_cfg['wing_sizes'][name]['num_cell_chord'] + 1, meshType='Bump', coef=mesh_cfg['wing_sizes'][name]['prog_chord'])
+                    geo.mesh.set_transfinite_curve(tags[j], mesh_cfg['wing_sizes'][name]['num_cell_chord'] + 1, meshType='Bump', coef=mesh_cfg['wing_sizes'][name]['prog_chord'])
             for i in range(n_airf - 1):
                 for j in range(3):
-                    gmsh.model.geo.mesh.set_transfinite_curve(plan_ctags[i][j], mesh_cfg['wing_sizes'][name]['num_cell_span'][i] + 1)
+                    geo.mesh.set_transfinite_curve(plan_ctags[i][j], mesh_cfg['wing_sizes'][name]['num_cell_span'][i] + 1)
             # Trailing edge curves
             for i in range(n_airf - 1):
-                gmsh.model.geo.mesh.set_transfinite_curve(te_ctags[i], mesh_cfg['wing_sizes'][name]['num_cell_span'][i] + 1)
+                geo.mesh.set_transfinite_curve(te_ctags[i], mesh_cfg['wing_sizes'][name]['num_cell_span'][i] + 1)
             for i in range(n_airf):
                 for j in range(2):
-                    gmsh.model.geo.mesh.set_transfinite_curve(airf_te_ctags[i][j], 2)
+                    geo.mesh.set_transfinite_curve(airf_te_ctags[i][j], 2)
             # Tip curves
-            gmsh.model.geo.mesh.set_transfinite_curve(tip_ctag, mesh_cfg['wing_sizes'][name]['num_cell_chord'] + 1, meshType='Bump', coef=mesh_cfg['wing_sizes'][name]['prog_chord'])
-            gmsh.model.geo.mesh.set_transfinite_curve(tip_le_ctag, 2)
+            geo.mesh.set_transfinite_curve(tip_ctag, mesh_cfg['wing_sizes'][name]['num_cell_chord'] + 1, meshType='Bump', coef=mesh_cfg['wing_sizes'][name]['prog_chord'])
+            geo.mesh.set_transfinite_curve(tip_le_ctag, 2)
             # Surfaces
             for tag in stags:
-                gmsh.model.geo.mesh.set_transfinite_surface(tag)
-                gmsh.model.geo.mesh.set_recombine(2, tag)
+                geo.mesh.set_transfinite_surface(tag)
+                geo.mesh.set_recombine(2, tag)
         # Unstructured meshing constraints
         else:
+            sizes = mesh_cfg['wing_sizes'][name]
             # Leading and trailing edges
-            for i in range(n_airf):
-                gmsh.model.mesh.set_size([(0, ptags[i][0]), (0, ptags[i][-1])], mesh_cfg['wing_sizes'][name]['te'][i])
-                gmsh.model.mesh.set_size([(0, ptags[i][le_idx[i]])], mesh_cfg['wing_sizes'][name]['le'][i])
+            ptag_sizes = [(ptags[i][j], sizes['te'][i]) for i in range(n_airf) for j in (0, -1)]
+            ptag_sizes += [(ptags[i][le_idx[i]], sizes['le'][i]) for i in range(n_airf)]
             # Tip and trailing edge
             if domain_cfg['type'] == 'rans':
-                for i in range(n_airf):
-                    gmsh.model.mesh.set_size([(0, te_ptags[i])], mesh_cfg['wing_sizes'][name]['te'][i])
-                gmsh.model.mesh.set_size([(0, tip_ptags[-1])], mesh_cfg['wing_sizes'][name]['te'][i])
+                ptag_sizes += [(te_ptags[i], sizes['te'][i]) for i in range(n_airf)]
+                ptag_sizes.append((tip_ptags[-1], sizes['te'][n_airf-1]))
+            self.__set_sizes(ptag_sizes)
 
         # Generate tag dictionary
         if domain_cfg['type'] == 'rans':
@@ -336,3 +338,12 @@ class Wing:
                          'boundary_layer_volume': bl_vtags}
         else:
             self.tags = {'symmetry_curves': airf_ctags[0] + [airf_te_ctags[0]], 'wing_surfaces': stags}
+
+    def __set_sizes(self, ptag_sizes):
+        """Set mesh size on points, using a single Gmsh call for all the points sharing the same size
+        """
+        dim_tags = {}
+        for tag, size in ptag_sizes:
+            dim_tags.setdefault(size, []).append((0, tag))
+        for size, dtags in dim_tags.items():
+            gmsh.model.mesh.set_size(dtags, size)
@@ -48,18 +48,14 @@ def setup_workdir(testname, clean, verb=True):
     elif os.path.isdir(wdir) and clean:
         if verb: print('- cleaning', wdir)
         import shutil
-        for f in os.listdir(wdir):
-            fpth = os.path.join(wdir, f)
-            if os.path.isfile(fpth):
-                os.remove(fpth)
-            elif os.path.isdir(fpth):
-                shutil.rmtree(fpth)
+        shutil.rmtree(wdir)
+        os.makedirs(wdir)
     # change dir
     if verb: print('- changing to', wdir)
     os.chdir(wdir)
 
 def main():
-    import os, time, socket
+    import os, time, socket, runpy
     import gmshcfd
 
     # prepare run
@@ -73,8 +69,7 @@ def main():
     print('Starting test', testname)
     print('Time:', time.strftime('%c'))
     print('Hostname:', socket.gethostname())
-    script = open(testname, 'r', encoding='utf-8').read()
-    exec(compile(script, testname, 'exec'), {'__file__': testname, '__name__':'__main__'})
+    runpy.run_path(testname, run_name='__main__')
 
 if __name__ == '__main__':
     main()
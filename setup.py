@@ -30,6 +30,6 @@ setup(
     url='https://github.com/acrovato/gmshcfd',
     license='GNU General Public License 3.0',
     packages=find_packages(include=['gmshcfd*']),
-    install_requires=['numpy>=1.22', 'scipy>=1.10', 'gmsh==4.10.5'],
+    install_requires=['numpy>=1.23', 'scipy>=1.10', 'gmsh==4.10.5'],
     classifiers=['Operating System :: OS Independent', 'Programming Language :: Python'],
 )